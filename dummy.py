@@ -0,0 +1,259 @@
+"""Generate dummy data for local development and testing."""
+
+from __future__ import annotations
+
+import itertools
+import random
+import string
+
+import numpy as np
+from faker import Faker
+from loguru import logger
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+import models
+import settings
+
+SEQUENCE_ATTRIBUTES = ("flow", "storage_content")
+SCALAR_ATTRIBUTES = ("capacity", "total", "invest", "variable_costs")
+
+_RNG = np.random.default_rng()
+
+# Single shared instance; Faker construction loads all providers and is expensive
+fake = Faker()
+
+
+def _random_timeseries(n_series: int, length: int) -> np.ndarray:
+    """Create random timeseries as a 2D array with one row per series."""
+    return np.round(_RNG.uniform(-100.0, 100.0, size=(n_series, length)), 3)
+
+
+def _random_node_names(n_names: int) -> list[str]:
+    """Create random node names of the form 'node_<two digits><two letters>'."""
+    digits = _RNG.integers(0, 100, size=n_names)
+    letters = _RNG.choice(list(string.ascii_lowercase), size=(n_names, 2))
+    return [
+        f"node_{number:02d}{first}{second}"
+        for number, (first, second) in zip(digits, letters)
+    ]
+
+
+def _random_values(n_values: int) -> np.ndarray:
+    """Create random float values rounded to three digits."""
+    return np.round(_RNG.uniform(-99.0, 99.0, size=n_values), 3)
+
+
+def add_dummy_weathers(session: Session, n_weathers: int) -> list[int]:
+    """Insert random weather entries and return their IDs."""
+    rows = [
+        {
+            "name": f"weather_{fake.unique.word()}",
+            "description": fake.sentence(nb_words=6),
+        }
+        for _ in range(n_weathers)
+    ]
+    return list(
+        session.execute(
+            insert(models.Weather).returning(models.Weather.id),
+            rows,
+        ).scalars(),
+    )
+
+
+def add_dummy_climates(session: Session, n_climates: int) -> list[int]:
+    """Insert random climate entries and return their IDs."""
+    rows = [
+        {
+            "name": f"climate_{fake.unique.word()}",
+            "description": fake.sentence(nb_words=6),
+        }
+        for _ in range(n_climates)
+    ]
+    return list(
+        session.execute(
+            insert(models.Climate).returning(models.Climate.id),
+            rows,
+        ).scalars(),
+    )
+
+
+def add_dummy_periods(session: Session, n_periods: int) -> list[int]:
+    """Insert random period entries and return their IDs."""
+    rows = []
+    for i, year in enumerate(_RNG.integers(1990, 2051, size=n_periods)):
+        rows.append(
+            {
+                "name": f"dummy_period_{i}",
+                "reference_year": int(year),
+                "period_start": int(year) - 15,
+                "period_end": int(year) + 15,
+                "description": fake.sentence(nb_words=6),
+            },
+        )
+    return list(
+        session.execute(
+            insert(models.Period).returning(models.Period.id),
+            rows,
+        ).scalars(),
+    )
+
+
+def add_dummy_clusters(session: Session, n_clusters: int) -> list[int]:
+    """Insert random clusters with square envelope polygons and return their IDs."""
+    lons = _RNG.uniform(-179, 179, size=n_clusters)
+    lats = _RNG.uniform(-85, 85, size=n_clusters)
+    sizes = _RNG.uniform(0.05, 0.3, size=n_clusters)
+    # Let PostGIS build the squares from four floats instead of shipping WKT text
+    rows = [
+        {
+            "name": fake.unique.city(),
+            "geometry": func.ST_MakeEnvelope(lon - d, lat - d, lon + d, lat + d, 4326),
+        }
+        for lon, lat, d in zip(lons, lats, sizes)
+    ]
+    return list(
+        session.execute(
+            insert(models.Cluster).values(rows).returning(models.Cluster.id),
+        ).scalars(),
+    )
+
+
+def add_dummy_scenarios(
+    session: Session,
+    n_scenarios: int,
+    period_ids: list[int],
+    weather_ids: list[int],
+    climate_ids: list[int],
+) -> list[int]:
+    """Insert random scenarios built from unique period/weather/climate combinations."""
+    combinations = random.sample(
+        list(itertools.product(period_ids, weather_ids, climate_ids)),
+        k=n_scenarios,
+    )
+    rows = [
+        {
+            "name": f"dummy_{fake.unique.word()}_{i}",
+            "period_id": period_id,
+            "weather_id": weather_id,
+            "climate_id": climate_id,
+        }
+        for i, (period_id, weather_id, climate_id) in enumerate(combinations)
+    ]
+    return list(
+        session.execute(
+            insert(models.Scenario).returning(models.Scenario.id),
+            rows,
+        ).scalars(),
+    )
+
+
+def add_dummy_sensitivities(session: Session, n_sensitivities: int) -> None:
+    """Insert random sensitivity entries."""
+    attributes = _RNG.choice(SCALAR_ATTRIBUTES, size=n_sensitivities)
+    rows = [
+        {
+            "node": node,
+            "attribute": str(attribute),
+            "value": float(value),
+        }
+        for node, attribute, value in zip(
+            _random_node_names(n_sensitivities),
+            attributes,
+            _random_values(n_sensitivities),
+        )
+    ]
+    session.execute(insert(models.Sensitivity), rows)
+
+
+def add_dummy_results(
+    session: Session,
+    scenario_ids: list[int],
+    n_sequences: int,
+    n_scalars: int,
+    sequence_length: int,
+) -> None:
+    """Insert random sequence and scalar results for the given scenarios."""
+    timeseries = _random_timeseries(n_sequences, sequence_length)
+    totals = timeseries.sum(axis=1)
+    # Draw all foreign keys and categorical choices per table in one C-level call
+    sequence_scenario_ids = _RNG.choice(scenario_ids, size=n_sequences)
+    sequence_attributes = _RNG.choice(SEQUENCE_ATTRIBUTES, size=n_sequences)
+    sequence_exogenous = _RNG.random(n_sequences) < 0.5  # noqa: PLR2004
+    sequence_rows = [
+        {
+            "scenario_id": int(sequence_scenario_ids[i]),
+            "is_exogenous": bool(sequence_exogenous[i]),
+            "from_node": f"{fake.word()}_{i}",
+            "to_node": f"{fake.word()}_{i}",
+            "attribute": str(sequence_attributes[i]),
+            "timeseries": timeseries[i].tolist(),
+            "total_energy": float(totals[i]),
+        }
+        for i in range(n_sequences)
+    ]
+    scalar_values = _random_values(n_scalars)
+    scalar_scenario_ids = _RNG.choice(scenario_ids, size=n_scalars)
+    scalar_attributes = _RNG.choice(SCALAR_ATTRIBUTES, size=n_scalars)
+    scalar_exogenous = _RNG.random(n_scalars) < 0.5  # noqa: PLR2004
+    scalar_rows = [
+        {
+            "scenario_id": int(scalar_scenario_ids[i]),
+            "is_exogenous": bool(scalar_exogenous[i]),
+            "from_node": f"{fake.word()}_{i}",
+            "to_node": f"{fake.word()}_{i}",
+            "attribute": str(scalar_attributes[i]),
+            "value": float(scalar_values[i]),
+        }
+        for i in range(n_scalars)
+    ]
+    session.execute(insert(models.Sequence), sequence_rows)
+    session.execute(insert(models.Scalar), scalar_rows)
+
+
+def generate_dummy_data(  # noqa: PLR0913
+    n_weathers: int = 4,
+    n_climates: int = 4,
+    n_periods: int = 3,
+    n_clusters: int = 5,
+    n_scenarios: int = 10,
+    n_sensitivities: int = 20,
+    n_sequences: int = 200,
+    n_scalars: int = 200,
+    sequence_length: int = 8760,
+) -> None:
+    """
+    Fill the database with randomly generated dummy data.
+
+    All tables are seeded inside a single session and transaction. Parent tables
+    (weather, climate, period, cluster) are inserted first with a single bulk
+    INSERT ... RETURNING each, so that dependent scenario and result rows can be
+    wired up via the returned IDs without any per-row round-trips or flushes.
+    """
+    logger.info("Generating dummy data.")
+    with Session(settings.ENGINE) as session:
+        weather_ids = add_dummy_weathers(session, n_weathers)
+        climate_ids = add_dummy_climates(session, n_climates)
+        period_ids = add_dummy_periods(session, n_periods)
+        add_dummy_clusters(session, n_clusters)
+        scenario_ids = add_dummy_scenarios(
+            session,
+            n_scenarios,
+            period_ids,
+            weather_ids,
+            climate_ids,
+        )
+        add_dummy_sensitivities(session, n_sensitivities)
+        add_dummy_results(
+            session,
+            scenario_ids,
+            n_sequences,
+            n_scalars,
+            sequence_length,
+        )
+        session.commit()
+    logger.info(f"Generated dummy data for {len(scenario_ids)} scenarios.")
+
+
+if __name__ == "__main__":
+    generate_dummy_data()
@@ -2,15 +2,90 @@
 
 from __future__ import annotations
 
+import io
 import shutil
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
+import pandas as pd
+import sqlalchemy
 from loguru import logger
-from sqlalchemy import exc
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 import models
 import settings
+from scenarios import get_cluster_for_component
+
+
+def _bulk_insert(session: Session, model: type, rows: list[dict]) -> None:
+    """
+    Bulk-insert row dicts for the given model.
+
+    On SQLAlchemy 2.x this uses the insertmanyvalues executemany path; on 1.x
+    engines it falls back to bulk_insert_mappings, which equally bypasses the
+    per-instance unit-of-work machinery.
+    """
+    if not rows:
+        return
+    if sqlalchemy.__version__.startswith("1."):
+        session.bulk_insert_mappings(model, rows)
+    else:
+        session.execute(insert(model), rows)
+
+
+# Above this many sequence rows, COPY beats even batched INSERTs
+SEQUENCE_COPY_THRESHOLD = 1000
+
+_SEQUENCE_COPY_COLUMNS = (
+    "scenario_id",
+    "cluster_id",
+    "is_exogenous",
+    "from_node",
+    "to_node",
+    "attribute",
+    "timeseries",
+    "total_energy",
+)
+
+
+# COPY text format gives \, tab, newline and carriage return special meaning
+_COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"},
+)
+
+
+def _copy_escape(value: str) -> str:
+    """Escape a string for the COPY text format."""
+    return value.translate(_COPY_ESCAPES)
+
+
+def _copy_sequences(session: Session, rows: list[dict]) -> None:
+    """
+    Stream sequence rows through COPY FROM STDIN on the session's connection.
+
+    Using the session's underlying DBAPI connection keeps the load inside the
+    caller's transaction while bypassing per-row statement overhead. Text
+    columns are escaped per the COPY text rules, so both insert paths accept
+    the same labels.
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        timeseries = "{" + ",".join(map(str, row["timeseries"])) + "}"
+        cluster_id = row["cluster_id"] if row["cluster_id"] is not None else "\\N"
+        to_node = _copy_escape(row["to_node"]) if row["to_node"] is not None else "\\N"
+        from_node = _copy_escape(row["from_node"])
+        attribute = _copy_escape(row["attribute"])
+        buffer.write(
+            f"{row['scenario_id']}\t{cluster_id}\t{row['is_exogenous']}\t{from_node}\t"
+            f"{to_node}\t{attribute}\t{timeseries}\t{row['total_energy']}\n",
+        )
+    buffer.seek(0)
+    with session.connection().connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {settings.DB_SCHEMA}.sequence ({', '.join(_SEQUENCE_COPY_COLUMNS)}) FROM STDIN",
+            buffer,
+        )
 
 
 def store_results_in_folder(datapackage_name: str, results: dict) -> None:
@@ -41,8 +116,30 @@ def store_results_in_folder(datapackage_name: str, results: dict) -> None:
             return
     results_path.mkdir(exist_ok=True)
 
-    # Write results as CSVs
-    for nodes, data in results.items():
+    if settings.OEMOF_COMBINED_RESULTS:
+        # One concat and one to_csv per kind beats thousands of tiny files;
+        # the per-file open/close overhead dominates for small frames
+        scalars = {
+            nodes: data["scalars"]
+            for nodes, data in results.items()
+            if not data["scalars"].empty
+        }
+        if scalars:
+            pd.concat(scalars, names=["from_node", "to_node"]).to_csv(
+                results_path / "scalars.csv",
+                sep=";",
+            )
+        sequences = [
+            data["sequences"].assign(from_node=nodes[0], to_node=nodes[1])
+            for nodes, data in results.items()
+        ]
+        if sequences:
+            pd.concat(sequences).to_csv(results_path / "sequences.csv", sep=";")
+        return
+
+    # Write results as CSVs; writes are independent per node pair, so run them
+    # in a thread pool to overlap serialization with file I/O
+    def write_node_results(nodes: tuple, data: dict) -> None:
         if not data["scalars"].empty:
             data["scalars"].to_csv(
                 results_path / f"{nodes[0]}_{nodes[1]}_scalars.csv",
@@ -53,11 +150,20 @@ def store_results_in_folder(datapackage_name: str, results: dict) -> None:
             sep=";",
         )
 
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(write_node_results, nodes, data)
+            for nodes, data in results.items()
+        ]
+        for future in futures:
+            future.result()
+
 
 def store_scenario_results(
     scenario_id: int,
     input_data: dict,
     output_data: dict,
+    session: Session | None = None,
 ) -> None:
     """
     Store results of a scenario into the database.
@@ -76,48 +182,106 @@ def store_scenario_results(
         output_data (dict): Dictionary containing result data for the scenario. The keys
             are tuples of from_node and to_node, and the values are dictionaries
             containing 'scalars' and 'sequences' data.
+        session (Session | None): Session to reuse; when None, one is opened and
+            committed internally.
 
     Raises:
         ValueError: If the given scenario ID does not exist in the database.
 
     """
-    with Session(settings.ENGINE) as session:
-        # Check if a scenario exists
-        try:
-            session.get_one(models.Scenario, {"id": scenario_id})
-        except exc.NoResultFound as err:
-            raise ValueError(f"Scenario #{scenario_id} not found in database.") from err
-
-        for is_exogenous, data in ((True, input_data), (False, output_data)):
-            for (from_node, to_node), result in data.items():
-                from_node_label = from_node.label
-                to_node_label = to_node.label if to_node is not None else None
-
-                for attribute, value in result["scalars"].items():
-                    if not isinstance(value, (float, int, bool)):
-                        continue
-                    scalar_result = models.Scalar(
-                        scenario_id=scenario_id,
-                        is_exogenous=is_exogenous,
-                        from_node=from_node_label,
-                        to_node=to_node_label,
-                        attribute=attribute,
-                        value=float(value),
-                    )
-                    session.add(scalar_result)
-
-                for attribute, series in result["sequences"].items():
-                    cleaned_series = series.dropna()
-                    flow = models.Sequence(
-                        scenario_id=scenario_id,
-                        is_exogenous=is_exogenous,
-                        from_node=from_node_label,
-                        to_node=to_node_label,
-                        attribute=attribute,
-                        timeseries=cleaned_series.tolist(),
-                        total_energy=cleaned_series.sum(),
-                    )
-                    session.add(flow)
-
-        session.commit()
-        logger.info(f"Stored results for scenario #{scenario_id}.")
+    if session is None:
+        # Write-only ingest: no autoflush checks, and no expiring of state we
+        # never read back after commit
+        with Session(
+            settings.ENGINE,
+            autoflush=False,
+            expire_on_commit=False,
+        ) as own_session:
+            _store_scenario_results(own_session, scenario_id, input_data, output_data)
+            own_session.commit()
+        return
+    _store_scenario_results(session, scenario_id, input_data, output_data)
+
+
+def _store_scenario_results(
+    session: Session,
+    scenario_id: int,
+    input_data: dict,
+    output_data: dict,
+) -> None:
+    """
+    Accumulate and insert result rows within the given session; commit is left to the caller.
+
+    When both endpoints of a pair are clustered components, the from_node's
+    cluster wins; the to_node's cluster is only used as a fallback.
+    """
+    # Check if a scenario exists
+    exists = session.execute(
+        select(1).where(models.Scenario.id == scenario_id),
+    ).scalar()
+    if exists is None:
+        raise ValueError(f"Scenario #{scenario_id} not found in database.")
+
+    # Node labels recur across many pairs and both loops, so resolve each node
+    # to its label and each unique label to its cluster exactly once up front
+    labels: dict = {}
+    for data in (input_data, output_data):
+        for from_node, to_node in data:
+            labels[from_node] = from_node.label
+            if to_node is not None:
+                labels[to_node] = to_node.label
+    cluster_for = {
+        label: get_cluster_for_component(label) for label in set(labels.values())
+    }
+
+    scalar_rows = []
+    sequence_rows = []
+    for is_exogenous, data in ((True, input_data), (False, output_data)):
+        for (from_node, to_node), result in data.items():
+            from_node_label = labels[from_node]
+            to_node_label = labels.get(to_node)
+            cluster_id = cluster_for.get(from_node_label) or cluster_for.get(
+                to_node_label,
+            )
+
+            # Coerce and filter the whole Series at C level instead of
+            # per-value isinstance and NaN checks in Python
+            scalars = pd.to_numeric(result["scalars"], errors="coerce").dropna()
+            scalar_rows.extend(
+                {
+                    "scenario_id": scenario_id,
+                    "cluster_id": cluster_id,
+                    "is_exogenous": is_exogenous,
+                    "from_node": from_node_label,
+                    "to_node": to_node_label,
+                    "attribute": attribute,
+                    "value": float(value),
+                }
+                for attribute, value in scalars.items()
+            )
+
+            for attribute, series in result["sequences"].items():
+                # Dropping NaNs copies the full series, so only do it when needed
+                cleaned_series = series.dropna() if series.isna().any() else series
+                if cleaned_series.empty:
+                    continue
+                values = cleaned_series.to_numpy()
+                sequence_rows.append(
+                    {
+                        "scenario_id": scenario_id,
+                        "cluster_id": cluster_id,
+                        "is_exogenous": is_exogenous,
+                        "from_node": from_node_label,
+                        "to_node": to_node_label,
+                        "attribute": attribute,
+                        "timeseries": values.tolist(),
+                        "total_energy": float(values.sum()),
+                    },
+                )
+
+    _bulk_insert(session, models.Scalar, scalar_rows)
+    if len(sequence_rows) >= SEQUENCE_COPY_THRESHOLD:
+        _copy_sequences(session, sequence_rows)
+    else:
+        _bulk_insert(session, models.Sequence, sequence_rows)
+    logger.info(f"Stored results for scenario #{scenario_id}.")
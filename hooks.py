@@ -70,13 +70,15 @@ def adapt_energysystem(energysystem: EnergySystem, parameters: dict) -> EnergySy
     parameters = parameters or {}
     logger.info(f"Adapting parameters in ES using {parameters=}.")
 
+    nodes_by_label = {n.label: n for n in energysystem.nodes}
     for node_name, attributes in parameters.items():
         if node_name == "flow":
             logger.warning(
                 "This is deprecated. Flows are adapted using input_parameters and output_parameters instead.",
             )
             continue
-        if node_name not in [n.label for n in energysystem.nodes]:
+        node = nodes_by_label.get(node_name)
+        if node is None:
             log_msg = f"Cannot adapt component '{node_name}', as it cannot be found in energysystem."
             logger.warning(log_msg)
             continue
@@ -88,7 +90,6 @@ def adapt_energysystem(energysystem: EnergySystem, parameters: dict) -> EnergySy
             logger.warning(log_msg)
             continue
 
-        node = next(n for n in energysystem.nodes if node_name == n.label)
         for attribute, value in attributes.items():
             if not hasattr(node, attribute):
                 logger.warning(
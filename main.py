@@ -4,6 +4,8 @@ from __future__ import annotations
 
 
 import argparse
+import concurrent.futures
+import os
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,6 +14,7 @@ if TYPE_CHECKING:
 import export
 import models
 import scenarios
+import settings
 import simulation
 import views
 
@@ -19,26 +22,43 @@ import views
 NO_ARGS_FCT = ("setup", "nuke")
 
 
+def _init_worker() -> None:
+    """Discard pool connections inherited from the parent process."""
+    settings.ENGINE.dispose(close=False)
+
+
 def run_all() -> None:
-    """Run all scenarios store results in the database."""
-    for file in scenarios.get_scenarios_in_folder():
-        run_scenario(file)
+    """Run all scenarios in parallel processes and store results in the database."""
+    files = list(scenarios.get_scenarios_in_folder())
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_worker,
+    ) as executor:
+        list(executor.map(run_scenario, files))
     views.create_all_views(recreate=True)
 
 
 def run_scenario(file: str | Path) -> None:
     """Run scenario from scenario folder."""
     scenario_config = scenarios.load_scenario_settings_from_file(file)
-    scenario_id, created = scenarios.create_scenario(
-        scenario_config.name,
-        **scenario_config.scenario,
-    )
-    if created:
-        input_data, output_data = simulation.simulate_datapackage(
-            scenario_config.datapackage,
-            scenario_config.capacities,
+    # One session and transaction covers scenario creation and result storage
+    with scenarios.scenarios_session() as session:
+        scenario_id, created = scenarios.create_scenario(
+            scenario_config.name,
+            **scenario_config.scenario,
+            session=session,
         )
-        export.store_scenario_results(scenario_id, input_data, output_data)
+        if created:
+            input_data, output_data = simulation.simulate_datapackage(
+                scenario_config.datapackage,
+                scenario_config.capacities,
+            )
+            export.store_scenario_results(
+                scenario_id,
+                input_data,
+                output_data,
+                session=session,
+            )
 
 
 def handle_delete(args: argparse.Namespace) -> None:
@@ -60,9 +80,10 @@ def handle_run(args: argparse.Namespace) -> None:
 def handle_views(args: argparse.Namespace) -> None:
     """Handle scenario views."""
     if args.command == "recreate":
-        models.update_default_labels()
-        models.update_default_categories()
-        models.update_cluster_components()
+        with models.shared_session() as session:
+            models.update_default_labels(session)
+            models.update_default_categories(session)
+            models.update_cluster_components(session)
         views.create_all_views(recreate=True)
     elif args.command == "drop":
         views.delete_all_views()
@@ -1,12 +1,17 @@
 """Database models for the RESQ app."""
 
+import contextlib
+import functools
+import io
+from collections.abc import Iterator
 from typing import Any
 
 import geopandas as gpd
-from geoalchemy2 import Geometry
+import shapely
 from loguru import logger
 from sqlalchemy import (
     ARRAY,
+    REAL,
     Boolean,
     Column,
     Float,
@@ -16,19 +21,49 @@ from sqlalchemy import (
     MetaData,
     String,
     UniqueConstraint,
+    bindparam,
     delete,
+    func,
+    insert,
+    lambda_stmt,
     select,
     text,
 )
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, declarative_base, relationship
+from sqlalchemy.types import UserDefinedType
 
+import settings
 import views
-from settings import CATEGORIES, CLUSTER_GEOPACKAGE, CLUSTERS, DB_SCHEMA, ENGINE, LABELS
+from settings import CATEGORIES, CLUSTER_GEOPACKAGE, CLUSTERS, DB_SCHEMA, LABELS
 
 Base = declarative_base(metadata=MetaData(schema=DB_SCHEMA))
 
 
+class PostGISGeometry(UserDefinedType):
+    """
+    Minimal PostGIS polygon type.
+
+    Unlike GeoAlchemy2's Geometry, this type participates in SQLAlchemy's
+    compiled-statement cache (cache_ok), so statements touching Cluster are
+    compiled once instead of on every execution.
+    """
+
+    cache_ok = True
+
+    def get_col_spec(self, **kwargs) -> str:  # noqa: ARG002
+        """Return the DDL column type."""
+        return "geometry(POLYGON,4326)"
+
+    def bind_expression(self, bindvalue: Any) -> Any:  # noqa: ANN401
+        """Parse bound values as EWKT on the server."""
+        return func.ST_GeomFromEWKT(bindvalue, type_=self)
+
+    def column_expression(self, col: Any) -> Any:  # noqa: ANN401
+        """Return geometry columns as EWKB."""
+        return func.ST_AsEWKB(col, type_=self)
+
+
 DEFAULT_WEATHERS = [
     ("extreme1", "Extremes Wetter 1"),
     ("extreme2", "Extremes Wetter 2"),
@@ -159,7 +194,7 @@ class Cluster(Base):
 
     id = Column(Integer, primary_key=True)
     name = Column(String, unique=True)
-    geometry = Column(Geometry(geometry_type="POLYGON", srid=4326))
+    geometry = Column(PostGISGeometry())
 
 
 class ClusterComponent(Base):
@@ -176,26 +211,41 @@ class Sequence(Base):
     """Holds oemof timeseries results for a scenario."""
 
     __tablename__ = "sequence"
+
+    id = Column(Integer, primary_key=True)
+    scenario_id = Column(ForeignKey("scenario.id", ondelete="CASCADE"), nullable=False)
+    cluster_id = Column(ForeignKey("cluster.id", ondelete="SET NULL"), nullable=True)
+    is_exogenous = Column(Boolean, nullable=False)
+    from_node = Column(String)
+    to_node = Column(String)
+    attribute = Column(String)
+    # float4 halves storage and wire size vs. float8; single precision is more
+    # than enough for hourly energy flows
+    timeseries = Column(ARRAY(REAL))
+    total_energy = Column(Float)
+
     __table_args__ = (
         Index(
             "sequence_unique",
-            "scenario_id",
+            scenario_id,
             "from_node",
             "to_node",
             "attribute",
             unique=True,
         ),
+        # Dashboards filter by scenario and cluster; partial since most rows
+        # are not mapped to a cluster
+        Index(
+            "sequence_scenario_cluster",
+            scenario_id,
+            cluster_id,
+            postgresql_where=(cluster_id.is_not(None)),
+        ),
+        # Rows arrive grouped by scenario, so a BRIN index stays tiny and is
+        # nearly free to maintain while still serving scan-by-scenario queries
+        Index("sequence_scenario_brin", scenario_id, postgresql_using="brin"),
     )
 
-    id = Column(Integer, primary_key=True)
-    scenario_id = Column(ForeignKey("scenario.id", ondelete="CASCADE"), nullable=False)
-    is_exogenous = Column(Boolean, nullable=False)
-    from_node = Column(String)
-    to_node = Column(String)
-    attribute = Column(String)
-    timeseries = Column(ARRAY(Float))
-    total_energy = Column(Float)
-
 
 class Scalar(Base):
     """Holds oemof scalar results for a scenario."""
@@ -204,12 +254,23 @@ class Scalar(Base):
 
     id = Column(Integer, primary_key=True)
     scenario_id = Column(ForeignKey("scenario.id", ondelete="CASCADE"), nullable=False)
+    cluster_id = Column(ForeignKey("cluster.id", ondelete="SET NULL"), nullable=True)
     is_exogenous = Column(Boolean, nullable=False)
     from_node = Column(String)
     to_node = Column(String)
     attribute = Column(String)
     value = Column(Float)
 
+    __table_args__ = (
+        Index(
+            "scalar_scenario_cluster",
+            scenario_id,
+            cluster_id,
+            postgresql_where=(cluster_id.is_not(None)),
+        ),
+        Index("scalar_scenario_brin", scenario_id, postgresql_using="brin"),
+    )
+
 
 class Label(Base):
     """Holds mappings to label components based on from/to node."""
@@ -236,122 +297,202 @@ class Category(Base):
     is_renewable = Column(Boolean, nullable=False)
 
 
+@contextlib.contextmanager
+def shared_session() -> Iterator[Session]:
+    """
+    Yield one session for a series of loader calls, committing once at the end.
+
+    Sharing a session keeps the whole series in a single transaction and a
+    single pool checkout, instead of one connection and commit fsync per call.
+    """
+    with Session(settings.ENGINE) as session:
+        yield session
+        session.commit()
+
+
 def get_or_create(
     session,  # noqa: ANN001
     model,  # noqa: ANN001
     **kwargs: Any,  # noqa: ANN401
-) -> tuple[Any, bool]:
-    """
-    Get or create a model instance.
-
-    Returns instance and boolean if instance already exists.
+) -> tuple[int, bool]:
     """
-    instance = session.query(model).filter_by(**kwargs).first()
-    if instance:
-        return instance, False
-    instance = model(**kwargs)
-    session.add(instance)
-    session.commit()
-    return instance, True
+    Get or create a model instance and return its ID.
 
+    The creation path is a single INSERT ... ON CONFLICT DO NOTHING RETURNING
+    round-trip; only when the row already exists is a follow-up SELECT issued.
+    Transaction control is left to the caller.
 
-def update_default_labels() -> None:
-    """Migrate labels to database."""
-    with Session(ENGINE) as session:
-        session.execute(delete(Label))
-        logger.info("Adding default labels to the database.")
-        for component, label_data in LABELS.items():
-            instance = Label(
-                component=component,
-                label=label_data["label"],
-                is_bus=label_data["bus"],
-            )
-            session.add(instance)
+    Returns instance ID and boolean whether the instance has been created.
 
-        session.commit()
+    Raises:
+        ValueError: If the insert conflicts with a row that does not match all
+            of the given kwargs, so neither path yields an ID.
 
+    """
+    stmt = (
+        pg_insert(model).values(**kwargs).on_conflict_do_nothing().returning(model.id)
+    )
+    instance_id = session.execute(stmt).scalar()
+    if instance_id is not None:
+        return instance_id, True
+    instance_id = session.execute(select(model.id).filter_by(**kwargs)).scalar()
+    if instance_id is None:
+        # The insert hit a unique constraint, but the conflicting row differs
+        # in at least one other column, so the exact-match SELECT found nothing
+        msg = f"{model.__name__} with {kwargs} conflicts with an existing row that does not match all values."
+        raise ValueError(msg)
+    return instance_id, False
+
+
+@functools.lru_cache(maxsize=1)
+def get_lookup_ids() -> dict[str, dict[str, int]]:
+    """
+    Return name-to-ID mappings for the weather, climate and period tables.
 
-def update_default_categories() -> None:
-    """Migrate categories to database."""
-    with Session(ENGINE) as session:
-        session.execute(delete(Category))
-        logger.info("Adding default categories to the database.")
-        for (from_node, to_node), entries in CATEGORIES.items():
-            c = Category(
-                from_node=from_node,
-                to_node=to_node,
-                category=entries["category"],
-                carrier=entries["carrier"],
-                is_renewable=entries["is_renewable"],
-            )
-            session.add(c)
-        session.commit()
+    These tables are essentially static, so the mappings are fetched once per
+    process and cached; the default-data loaders clear the cache on change.
+    """
+    with Session(settings.ENGINE) as session:
+        return {
+            "weather": dict(session.execute(select(Weather.name, Weather.id)).all()),
+            "climate": dict(session.execute(select(Climate.name, Climate.id)).all()),
+            "period": dict(session.execute(select(Period.name, Period.id)).all()),
+        }
 
 
-def add_default_weather_and_climate() -> None:
+def update_default_labels(session: Session) -> None:
+    """Migrate labels to database."""
+    # TRUNCATE skips per-row WAL and dead tuples, and resets the ID sequence
+    session.execute(text(f"TRUNCATE TABLE {DB_SCHEMA}.label RESTART IDENTITY CASCADE"))
+    logger.info("Adding default labels to the database.")
+    rows = [
+        {
+            "component": component,
+            "label": label_data["label"],
+            "is_bus": label_data["bus"],
+        }
+        for component, label_data in LABELS.items()
+    ]
+    session.execute(insert(Label), rows)
+
+
+def update_default_categories(session: Session) -> None:
+    """Migrate categories to database."""
+    session.execute(
+        text(f"TRUNCATE TABLE {DB_SCHEMA}.category RESTART IDENTITY CASCADE"),
+    )
+    logger.info("Adding default categories to the database.")
+    rows = [
+        {
+            "from_node": from_node,
+            "to_node": to_node,
+            "category": entries["category"],
+            "carrier": entries["carrier"],
+            "is_renewable": entries["is_renewable"],
+        }
+        for (from_node, to_node), entries in CATEGORIES.items()
+    ]
+    session.execute(insert(Category), rows)
+
+
+def add_default_weather_and_climate(session: Session) -> None:
     """Add default weather and climate entries to the database."""
     logger.info("Adding default weather and climate entries to the database.")
-    with Session(ENGINE) as session:
-        for name, description in DEFAULT_WEATHERS:
-            w = Weather(name=name, description=description)
-            session.add(w)
-        for name, description in DEFAULT_CLIMATES:
-            c = Climate(name=name, description=description)
-            session.add(c)
-
-        try:
-            session.commit()
-        except IntegrityError:
-            logger.warning("Default weather and climate entries already exist.")
+    session.execute(
+        pg_insert(Weather).on_conflict_do_nothing(),
+        [
+            {"name": name, "description": description}
+            for name, description in DEFAULT_WEATHERS
+        ],
+    )
+    session.execute(
+        pg_insert(Climate).on_conflict_do_nothing(),
+        [
+            {"name": name, "description": description}
+            for name, description in DEFAULT_CLIMATES
+        ],
+    )
+    get_lookup_ids.cache_clear()
 
 
-def add_default_periods() -> None:
+def add_default_periods(session: Session) -> None:
     """Migrate periods to database."""
-    with Session(ENGINE) as session:
-        logger.info("Adding default periods to the database.")
-        for name, year, start, end, description in DEFAULT_PERIODS:
-            p = Period(
-                name=name,
-                reference_year=year,
-                period_start=start,
-                period_end=end,
-                description=description,
-            )
-            session.add(p)
-        try:
-            session.commit()
-        except IntegrityError:
-            logger.warning("Default periods already exist.")
+    logger.info("Adding default periods to the database.")
+    session.execute(
+        pg_insert(Period).on_conflict_do_nothing(),
+        [
+            {
+                "name": name,
+                "reference_year": year,
+                "period_start": start,
+                "period_end": end,
+                "description": description,
+            }
+            for name, year, start, end, description in DEFAULT_PERIODS
+        ],
+    )
+    get_lookup_ids.cache_clear()
 
 
-def add_clusters_from_geopackage() -> None:
+def add_clusters_from_geopackage(session: Session) -> None:
     """Add clusters from a GeoPackage to the database."""
     logger.info("Adding clusters from a GeoPackage to the database.")
-    with Session(ENGINE) as session:
-        select_stmt = select(Cluster.id).limit(1)
-        result = session.execute(select_stmt).first()
-        if result is not None:
-            logger.warning("Clusters already exist in the database.")
-            return
-
-        try:
-            gdf = gpd.read_file(CLUSTER_GEOPACKAGE)
-        except FileNotFoundError:
-            logger.error(f"GeoPackage file not found at {CLUSTER_GEOPACKAGE}")
-            return
-
-        for _, row in gdf.iterrows():
-            cluster = Cluster(name=row["name"], geometry=row["geometry"].wkt)
-            session.add(cluster)
-        session.commit()
-        logger.info(f"Added {len(gdf)} clusters from GeoPackage")
+    result = session.execute(select(Cluster.id).limit(1)).first()
+    if result is not None:
+        logger.warning("Clusters already exist in the database.")
+        return
+
+    try:
+        # pyogrio reads much faster than the Fiona default, and only the
+        # name column (plus geometry) is needed downstream
+        gdf = gpd.read_file(CLUSTER_GEOPACKAGE, engine="pyogrio", columns=["name"])
+    except FileNotFoundError:
+        logger.error(f"GeoPackage file not found at {CLUSTER_GEOPACKAGE}")
+        return
+
+    # Stream the geometries through COPY, which is much faster than INSERT
+    # for bulk loads and bypasses per-row statement overhead entirely.
+    # Hex-encoded EWKB is produced in one vectorized call and needs no
+    # text-to-float parsing on the server, unlike WKT
+    ewkb = shapely.to_wkb(
+        shapely.set_srid(gdf.geometry.values, 4326),
+        hex=True,
+        include_srid=True,
+    )
+    buffer = io.StringIO()
+    for name, geometry in zip(gdf["name"], ewkb):
+        buffer.write(f"{name}\t{geometry}\n")
+    buffer.seek(0)
+    raw_connection = settings.ENGINE.raw_connection()
+    try:
+        with raw_connection.cursor() as cursor:
+            # Load into an unindexed table and build the GiST index afterwards;
+            # maintaining the index per row is the expensive part of spatial ingest
+            cursor.execute(f"DROP INDEX IF EXISTS {DB_SCHEMA}.idx_cluster_geometry")
+            cursor.copy_expert(
+                f"COPY {DB_SCHEMA}.cluster (name, geometry) FROM STDIN",
+                buffer,
+            )
+            cursor.execute(
+                f"CREATE INDEX idx_cluster_geometry ON {DB_SCHEMA}.cluster USING gist (geometry)",
+            )
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+    logger.info(f"Added {len(gdf)} clusters from GeoPackage")
+
+
+# Built once so that SQLAlchemy reuses the compiled statement across calls
+# instead of recompiling an identically-shaped SELECT per lookup
+_CLUSTER_BY_NAME_STMT = lambda_stmt(
+    lambda: select(Cluster.id).where(Cluster.name == bindparam("name")),
+)
 
 
 def get_cluster_by_name(cluster_name: str) -> int:
     """Return cluster ID by its name."""
-    with Session(ENGINE) as session:
-        stmt = select(Cluster.id).where(Cluster.name == cluster_name)
-        result = session.execute(stmt).scalar()
+    with Session(settings.ENGINE) as session:
+        result = session.execute(_CLUSTER_BY_NAME_STMT, {"name": cluster_name}).scalar()
         if result is None:
             error_msg = f"Cluster named '{cluster_name}' not found in database."
             logger.error(error_msg)
@@ -359,40 +500,82 @@ def get_cluster_by_name(cluster_name: str) -> int:
         return int(result)
 
 
-def update_cluster_components() -> None:
+def update_cluster_components(session: Session) -> None:
     """Migrate cluster componentes to database."""
-    with Session(ENGINE) as session:
-        session.execute(delete(ClusterComponent))
-        logger.info("Adding default cluster component mappings to the database.")
-        for cluster, components in CLUSTERS.items():
-            cluster_id = get_cluster_by_name(cluster)
-            for component in components:
-                c = ClusterComponent(
-                    from_node=component,
-                    cluster_id=cluster_id,
-                )
-                session.add(c)
+    session.execute(delete(ClusterComponent))
+    logger.info("Adding default cluster component mappings to the database.")
+    for cluster, components in CLUSTERS.items():
+        cluster_id = get_cluster_by_name(cluster)
+        for component in components:
+            c = ClusterComponent(
+                from_node=component,
+                cluster_id=cluster_id,
+            )
+            session.add(c)
+
+
+# Above this many rows, maintaining sequence_unique per insert costs more
+# than rebuilding it once after the load
+BULK_LOAD_REINDEX_THRESHOLD = 100_000
+
+
+def bulk_load_sequences(scenario_id: int, rows: list[dict]) -> None:
+    """
+    Bulk-load sequence rows for a single scenario.
+
+    Rows are inserted with one executemany statement. For very large loads the
+    sequence_unique index is dropped up front and rebuilt afterwards with extra
+    maintenance_work_mem, which is far cheaper than per-row B-tree inserts.
+
+    Args:
+        scenario_id (int): ID of the scenario the rows belong to.
+        rows (list[dict]): Sequence row dicts (without scenario_id).
+
+    """
+    if not rows:
+        return
+    reindex = len(rows) >= BULK_LOAD_REINDEX_THRESHOLD
+    with Session(settings.ENGINE) as session:
+        session.execute(text("SET LOCAL maintenance_work_mem = '1GB'"))
+        if reindex:
+            session.execute(text(f"DROP INDEX IF EXISTS {DB_SCHEMA}.sequence_unique"))
+        session.execute(
+            insert(Sequence),
+            [{**row, "scenario_id": scenario_id} for row in rows],
+        )
+        if reindex:
+            session.execute(
+                text(
+                    f"CREATE UNIQUE INDEX sequence_unique ON {DB_SCHEMA}.sequence "
+                    "(scenario_id, from_node, to_node, attribute)",
+                ),
+            )
         session.commit()
+    logger.info(f"Bulk-loaded {len(rows)} sequences for scenario #{scenario_id}.")
 
 
 def setup_db() -> None:
     """Set up DB schema and tables from models."""
     logger.info("Setting up DB schema and tables.")
-    with ENGINE.connect() as connection:
+    with settings.ENGINE.connect() as connection:
         connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {DB_SCHEMA}"))
         connection.commit()
-    Base.metadata.create_all(ENGINE)
-    add_default_weather_and_climate()
-    add_default_periods()
-    update_default_labels()
-    update_default_categories()
-    add_clusters_from_geopackage()
-    update_cluster_components()
+    Base.metadata.create_all(settings.ENGINE)
+    with shared_session() as session:
+        # Setup is idempotent, so skipping the per-step WAL flush is safe;
+        # everything below commits once at the end
+        session.execute(text("SET LOCAL synchronous_commit = off"))
+        add_default_weather_and_climate(session)
+        add_default_periods(session)
+        update_default_labels(session)
+        update_default_categories(session)
+        add_clusters_from_geopackage(session)
+        update_cluster_components(session)
 
 
 def teardown_db() -> None:
     """Drop DB schema and tables."""
     logger.info("Tearing down DB tables and views.")
     views.delete_all_views()
-    Base.metadata.drop_all(ENGINE)
+    Base.metadata.drop_all(settings.ENGINE)
     logger.info("Dropped database.")
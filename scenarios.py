@@ -2,20 +2,60 @@
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 import yaml
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import delete, select, text
 from sqlalchemy.orm import Session
 
 import models
-from settings import ENGINE, SCENARIOS_DIR
+import settings
+from settings import COMPONENT_CLUSTERS, DB_SCHEMA, SCENARIOS_DIR
+
+# The C loader parses YAML an order of magnitude faster and releases the GIL
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.cache
+def _cluster_name_to_id() -> dict[str, int]:
+    """Fetch the (static) cluster name-to-ID mapping once per process."""
+    with Session(settings.ENGINE) as session:
+        return dict(
+            session.execute(select(models.Cluster.name, models.Cluster.id)).all(),
+        )
+
+
+def get_cluster_for_component(component: str) -> int | None:
+    """
+    Return the cluster ID for a component, or None if the component is not mapped.
+
+    Raises:
+        KeyError: If the mapped cluster is not found in the database.
+
+    """
+    cluster_name = COMPONENT_CLUSTERS.get(component)
+    if cluster_name is None:
+        return None
+    cluster_id = _cluster_name_to_id().get(cluster_name)
+    if cluster_id is None:
+        error_msg = f"Cluster '{cluster_name}' for component '{component}' not found in database."
+        logger.error(error_msg)
+        raise KeyError(error_msg)
+    return cluster_id
+
+
+def get_cluster_ids_for_components(components: Iterable[str]) -> dict[str, int | None]:
+    """Resolve cluster IDs for many components at once without per-call queries."""
+    return {component: get_cluster_for_component(component) for component in components}
 
 
 @dataclasses.dataclass(frozen=True)
@@ -48,18 +88,38 @@ def load_scenario_settings_from_file(filepath: str | Path) -> ScenarioConfig:
         logger.error(error_msg)
         raise FileNotFoundError(error_msg)
     with filepath.open("r", encoding="utf-8") as f:
-        scenario_config = yaml.safe_load(f)
+        scenario_config = yaml.load(f, Loader=_YAML_LOADER)  # noqa: S506
     if "name" not in scenario_config:
         scenario_config["name"] = filepath.stem
     return ScenarioConfig(**scenario_config)
 
 
-def create_scenario(
+def load_all_scenario_settings(folder: Path = SCENARIOS_DIR) -> list[ScenarioConfig]:
+    """Load all scenario configurations from a folder, parsing the YAML files in parallel threads."""
+    files = list(get_scenarios_in_folder(folder))
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(load_scenario_settings_from_file, files))
+
+
+@contextlib.contextmanager
+def scenarios_session() -> Iterator[Session]:
+    """
+    Yield one session for a whole scenario unit of work, committing once.
+
+    Wrapping create_scenario and store_scenario_results in one of these runs
+    the pipeline in a single transaction and pool checkout.
+    """
+    with models.shared_session() as session:
+        yield session
+
+
+def create_scenario(  # noqa: PLR0913
     name: str,
     period: str,
     climate: str,
     weather: str,
     sensitivity_id: int | None = None,
+    session: Session | None = None,
 ) -> tuple[int, bool]:
     """
     Create a new scenario in the database with given setup.
@@ -74,6 +134,8 @@ def create_scenario(
         climate (str): The name of the climate type for the scenario.
         weather (str): The name of the weather type for the scenario.
         sensitivity_id (int | None): The optional sensitivity identifier for the scenario.
+        session (Session | None): Session to reuse; when None, one is opened and
+            committed internally.
 
     Returns:
         int: The unique identifier of the created scenario.
@@ -83,35 +145,58 @@ def create_scenario(
         KeyError: If the specified climate or weather is not found in the database.
 
     """
-    with Session(ENGINE) as session:
-        period_id = session.execute(
-            select(models.Period.id).where(models.Period.name == period),
-        ).scalar_one_or_none()
-        climate_id = session.execute(
-            select(models.Climate.id).where(models.Climate.name == climate),
-        ).scalar_one_or_none()
-        weather_id = session.execute(
-            select(models.Weather.id).where(models.Weather.name == weather),
-        ).scalar_one_or_none()
-        if climate_id is None:
-            raise KeyError(f"Climate '{climate}' not found in database.")
-        if weather_id is None:
-            raise KeyError(f"Weather '{weather}' not found in database.")
-
-        scenario, created = models.get_or_create(
-            session,
-            models.Scenario,
-            name=name,
-            period_id=period_id,
-            weather_id=int(weather_id),
-            climate_id=int(climate_id),
-            sensitivity_id=sensitivity_id,
-        )
-        if created:
-            logger.info(f"Created scenario #{scenario.id} ({scenario}).")
-        else:
-            logger.warning(f"Scenario #{scenario.id} ({scenario}) already exists.")
-        return scenario.id, created
+    lookups = models.get_lookup_ids()
+    period_id = lookups["period"].get(period)
+    climate_id = lookups["climate"].get(climate)
+    weather_id = lookups["weather"].get(weather)
+    if climate_id is None:
+        raise KeyError(f"Climate '{climate}' not found in database.")
+    if weather_id is None:
+        raise KeyError(f"Weather '{weather}' not found in database.")
+
+    if session is None:
+        with scenarios_session() as own_session:
+            return _create_scenario(
+                own_session,
+                name,
+                period_id,
+                weather_id,
+                climate_id,
+                sensitivity_id,
+            )
+    return _create_scenario(
+        session,
+        name,
+        period_id,
+        weather_id,
+        climate_id,
+        sensitivity_id,
+    )
+
+
+def _create_scenario(  # noqa: PLR0913
+    session: Session,
+    name: str,
+    period_id: int | None,
+    weather_id: int,
+    climate_id: int,
+    sensitivity_id: int | None,
+) -> tuple[int, bool]:
+    """Insert the scenario row within the given session; commit is left to the caller."""
+    scenario_id, created = models.get_or_create(
+        session,
+        models.Scenario,
+        name=name,
+        period_id=period_id,
+        weather_id=int(weather_id),
+        climate_id=int(climate_id),
+        sensitivity_id=sensitivity_id,
+    )
+    if created:
+        logger.info(f"Created scenario #{scenario_id} ({name}).")
+    else:
+        logger.warning(f"Scenario #{scenario_id} ({name}) already exists.")
+    return scenario_id, created
 
 
 def delete_scenario(scenario_id: int) -> None:
@@ -122,14 +207,23 @@ def delete_scenario(scenario_id: int) -> None:
         scenario_id (int): ID of the scenario to delete.
 
     """
-    with Session(ENGINE) as session:
-        session.delete(session.get(models.Scenario, scenario_id))
+    with Session(settings.ENGINE) as session:
+        session.execute(
+            delete(models.Scenario).where(models.Scenario.id == scenario_id),
+        )
+        session.commit()
     logger.info(f"Scenario #{scenario_id} deleted from database.")
 
 
 def delete_all_scenarios() -> None:
     """Delete all scenarios from the database."""
-    with Session(ENGINE) as session:
-        session.query(models.Scenario).delete()
+    with Session(settings.ENGINE) as session:
+        # TRUNCATE is the PostgreSQL fast path and skips the ORM cascade
+        # machinery; results are removed alongside their scenarios
+        session.execute(
+            text(
+                f"TRUNCATE {DB_SCHEMA}.scenario, {DB_SCHEMA}.sequence, {DB_SCHEMA}.scalar RESTART IDENTITY CASCADE",
+            ),
+        )
         session.commit()
     logger.info("All scenarios deleted from database.")
@@ -5,7 +5,12 @@ from __future__ import annotations
 import json
 import os
 import pathlib
+import pickle
 import warnings
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -43,27 +48,92 @@ def connect_to_db(url: str) -> Engine:
     return create_engine(
         DATABASE_URL,
         connect_args={"options": f"-c search_path={DB_SCHEMA},public"},
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        executemany_batch_page_size=500,
+        pool_pre_ping=True,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_timeout=30,
+        pool_recycle=1800,
     )
 
 
-ENGINE = connect_to_db(DATABASE_URL)
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """
+    Create the engine lazily on first attribute access (PEP 562).
+
+    Imports that only need constants (e.g. COMPONENT_CLUSTERS in tests) no
+    longer pay engine construction or fail when the database is unreachable.
+    """
+    if name == "ENGINE":
+        engine = connect_to_db(DATABASE_URL)
+        globals()["ENGINE"] = engine
+        return engine
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 # --- OEMOF Settings ---
 OEMOF_WRITE_RESULTS = os.getenv("OEMOF_WRITE_RESULTS", "False") == "True"
 OEMOF_SCENARIO = os.getenv("OEMOF_SCENARIO", "dispatch")
 OEMOF_OVERWRITE_RESULTS = os.getenv("OEMOF_OVERWRITE_RESULTS", "False") == "True"
+OEMOF_COMBINED_RESULTS = os.getenv("OEMOF_COMBINED_RESULTS", "True") == "True"
 
 # --- Cluster Mapping ---
 CLUSTER_COMPONENT_FILE = CONFIG_DIR / "clusters.json"
 CLUSTER_GEOPACKAGE = GEOPACKAGES_DIR / "clusters.gpkg"
 
-with CLUSTER_COMPONENT_FILE.open("r", encoding="utf-8") as json_file:
-    CLUSTERS = json.load(json_file)
 
-# --- Labels and categories Mapping ---
-with (CONFIG_DIR / "labels.json").open("r", encoding="utf-8") as json_file:
-    LABELS: dict[str, dict[str, bool | str]] = json.load(json_file)
+def _load_cached(
+    path: pathlib.Path,
+    build: Callable[[dict], Any],
+) -> Any:  # noqa: ANN401
+    """
+    Load a parsed config mapping, caching the built result as a pickle.
+
+    The pickle sits next to the JSON file and is keyed on the source's mtime
+    and size; unpickling a ready-made dict is much faster than re-parsing the
+    JSON and re-running the post-processing on every interpreter start.
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_path = path.with_suffix(".pkl")
+    if cache_path.exists():
+        try:
+            with cache_path.open("rb") as cache_file:
+                cached_stamp, value = pickle.load(cache_file)  # noqa: S301
+            if cached_stamp == stamp:
+                return value
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            logger.debug(f"Discarding stale config cache at {cache_path}")
+    # Parsing from bytes skips the incremental TextIOWrapper decode pass
+    value = build(json.loads(path.read_bytes()))
+    try:
+        with cache_path.open("wb") as cache_file:
+            pickle.dump((stamp, value), cache_file)
+    except OSError:
+        logger.debug(f"Could not write config cache at {cache_path}")
+    return value
+
+
+CLUSTERS = _load_cached(CLUSTER_COMPONENT_FILE, lambda raw: raw)
+
+# Inverse component-to-cluster mapping, precomputed once at import so that
+# membership checks and lookups in hot loops are O(1)
+COMPONENT_CLUSTERS: dict[str, str] = {
+    component: cluster
+    for cluster, components in CLUSTERS.items()
+    for component in components
+}
 
-with (CONFIG_DIR / "categories.json").open("r", encoding="utf-8") as json_file:
-    categories_raw = json.load(json_file)
-CATEGORIES = {tuple(key.split("|")): value for key, value in categories_raw.items()}
+# --- Labels and categories Mapping ---
+LABELS: dict[str, dict[str, bool | str]] = _load_cached(
+    CONFIG_DIR / "labels.json",
+    lambda raw: raw,
+)
+
+CATEGORIES = _load_cached(
+    CONFIG_DIR / "categories.json",
+    lambda raw: {tuple(key.split("|")): value for key, value in raw.items()},
+)
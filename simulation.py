@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+
 from oemof.solph import EnergySystem, Model, processing
 from oemof.tabular import datapackage  # noqa: F401
 from oemof.tabular.constraint_facades import CONSTRAINT_TYPE_MAP
@@ -11,6 +14,21 @@ import hooks
 import settings
 
 
+@functools.lru_cache(maxsize=4)
+def build_energysystem(datapackage_name: str) -> EnergySystem:
+    """
+    Build an energy system from a datapackage, cached per datapackage.
+
+    Parsing the datapackage and constructing the facades dominates small
+    dispatch runs; sensitivity sweeps over the same package reuse the cached
+    system and only pay for a deepcopy per variant.
+    """
+    datapackage_json = str(
+        settings.DATAPACKAGE_DIR / datapackage_name / "datapackage.json",
+    )
+    return EnergySystem.from_datapackage(datapackage_json, typemap=TYPEMAP)
+
+
 def simulate_datapackage(
     datapackage_name: str,
     parameters: dict | None = None,
@@ -36,7 +54,8 @@ def simulate_datapackage(
     datapackage_json = str(
         settings.DATAPACKAGE_DIR / datapackage_name / "datapackage.json",
     )
-    es = EnergySystem.from_datapackage(datapackage_json, typemap=TYPEMAP)
+    # Deepcopy the cached system so adapt_energysystem can mutate it freely
+    es = copy.deepcopy(build_energysystem(datapackage_name))
 
     # Adapt ES from parameters
     parameters = parameters or {}
@@ -1,13 +1,35 @@
 """Create materialized views from SQL files."""
 
+import functools
+import graphlib
+import hashlib
+import mmap
+import os
+import re
+import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from loguru import logger
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.orm import Session
 
-from settings import ENGINE, VIEWS_DIR
+import settings
+from settings import VIEWS_DIR
+
+
+@functools.lru_cache(maxsize=1)
+def _view_list(mtime_ns: int) -> tuple[Path, ...]:  # noqa: ARG001
+    """Scan the views directory once per directory mtime."""
+    # scandir filters on the raw entry name and only builds Path objects for
+    # the files that actually qualify
+    with os.scandir(VIEWS_DIR) as entries:
+        return tuple(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".sql")
+        )
 
 
 def get_views() -> Iterable[Path]:
@@ -18,48 +40,193 @@ def get_views() -> Iterable[Path]:
     extension, reads their content, removes trailing semicolons, and retrieves their
     stem and query content as a tuple.
 
+    The scan is cached on the directory's mtime, so adding or removing a view
+    file invalidates it automatically.
+
     Yields:
         Iterable[Path]: An iterable of paths to SQL files.
 
     """
-    for view in VIEWS_DIR.iterdir():
-        if view.suffix != ".sql":
-            continue
-        yield view
+    return iter(_view_list(VIEWS_DIR.stat().st_mtime_ns))
+
+
+# Below this size a plain read is cheaper than setting up a mapping
+_MMAP_THRESHOLD = 16 * 1024
+
+
+@functools.lru_cache(maxsize=256)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:  # noqa: ARG001
+    """Read and trim a SQL file; the mtime/size key invalidates on file change."""
+    if size < _MMAP_THRESHOLD:
+        data = Path(path).read_bytes()
+    else:
+        # Large definitions come straight out of the page cache without an
+        # intermediate read buffer
+        with (
+            Path(path).open("rb") as sql_file,
+            mmap.mmap(sql_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            data = bytes(mapped)
+    # Only strip the statement terminator; a global replace would also corrupt
+    # semicolons inside string literals and costs an extra full-buffer copy
+    return data.decode("utf-8").rstrip().rstrip(";")
 
 
 def read_query(view: Path) -> str:
-    """Read a SQL query from a file."""
-    with view.open("r", encoding="utf-8") as view_file:
-        query = view_file.read()
-        query = query.replace(";", "")
-        return query
+    """Read a SQL query from a file, trimming the trailing semicolon."""
+    stat = view.stat()
+    return _read_cached(str(view), stat.st_mtime_ns, stat.st_size)
+
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _validate_identifier(name: str) -> str:
+    """
+    Validate a view name before it is interpolated into DDL.
+
+    View names come from file stems and cannot be bound as parameters in DDL,
+    so they are checked against a strict identifier pattern instead.
+
+    Raises:
+        ValueError: If the name is not a plain SQL identifier.
+
+    """
+    if not _IDENTIFIER_PATTERN.match(name):
+        msg = f"Invalid view identifier: '{name}'"
+        raise ValueError(msg)
+    return name
+
+
+_VIEW_META_DDL = "CREATE TABLE IF NOT EXISTS resqdb_view_meta (view_name TEXT PRIMARY KEY, sql_sha256 TEXT)"
+
+
+def _ensure_view_meta(session: Session) -> None:
+    """Create the table tracking each view's SQL hash if it does not exist yet."""
+    session.execute(text(_VIEW_META_DDL))
+
 
+def _exec_many(statements: Iterable[str | tuple[str, tuple]]) -> None:
+    """
+    Run plain DDL/DML statements on a raw DB-API cursor under one commit.
+
+    For statements that return nothing, this skips the Session and expression
+    layers entirely; parameterized statements are passed as (sql, params).
+    """
+    raw_connection = settings.ENGINE.raw_connection()
+    try:
+        with raw_connection.cursor() as cursor:
+            for statement in statements:
+                if isinstance(statement, tuple):
+                    cursor.execute(*statement)
+                else:
+                    cursor.execute(statement)
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+
+
+def _stored_view_hashes() -> dict[str, str]:
+    """Fetch all stored view hashes in one round-trip."""
+    with Session(settings.ENGINE) as session:
+        _ensure_view_meta(session)
+        session.commit()
+        return dict(
+            session.execute(
+                text("SELECT view_name, sql_sha256 FROM resqdb_view_meta"),
+            ).all(),
+        )
+
+
+def _view_exists(session: Session, view_name: str) -> bool:
+    """Check whether a materialized view of the given name exists."""
+    stmt = text("SELECT 1 FROM pg_matviews WHERE matviewname = :name")
+    return session.execute(stmt, {"name": view_name}).scalar() is not None
+
+
+@functools.lru_cache(maxsize=64)
+def _drop_stmt(view_name: str) -> TextClause:
+    """Return the cached DROP statement for a view name."""
+    return text(f"DROP MATERIALIZED VIEW IF EXISTS {view_name};")
 
-def create_view(view_name: str, query: str, *, recreate: bool = False) -> None:
+
+@functools.lru_cache(maxsize=64)
+def _refresh_stmt(view_name: str) -> TextClause:
+    """Return the cached REFRESH statement shared by the refresh and populate paths."""
+    return text(f"REFRESH MATERIALIZED VIEW {view_name};")
+
+
+_UNKNOWN_HASH = object()
+
+
+def create_view(
+    view_name: str,
+    query: str,
+    *,
+    recreate: bool = False,
+    stored_hash: str | None | object = _UNKNOWN_HASH,
+) -> None:
     """
-    Create or recreate a materialized view in the database with the specified query.
+    Create, refresh or recreate a materialized view with the specified query.
 
     This function handles the creation of a materialized view in the database. If the
-    `recreate` flag is set to True, it will first drop the materialized view if it
-    exists before creating it again. Otherwise, it will ensure that the view exists
+    `recreate` flag is set to True and the view's SQL definition is unchanged since
+    the last build (tracked via a hash in resqdb_view_meta), the existing view is
+    refreshed in place, keeping its indexes and grants; only a changed definition
+    triggers a drop and re-create. Otherwise, it will ensure that the view exists
     but will not overwrite it if it already exists.
 
     Args:
         view_name (str): The name of the materialized view to be created or recreated.
         query (str): The SQL query used to define the view.
-        recreate (bool, optional): When set to True, drops and recreates the view even
-            if it already exists. Defaults to False.
+        recreate (bool, optional): When set to True, refreshes or recreates the view
+            even if it already exists. Defaults to False.
+        stored_hash (str | None, optional): Previously stored definition hash, as
+            prefetched by create_all_views; left unset, it is looked up here.
 
     """
-    with Session(ENGINE) as session:
+    _validate_identifier(view_name)
+    sql_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    with Session(settings.ENGINE) as session:
+        if stored_hash is _UNKNOWN_HASH:
+            _ensure_view_meta(session)
+            stored_hash = session.execute(
+                text("SELECT sql_sha256 FROM resqdb_view_meta WHERE view_name = :name"),
+                {"name": view_name},
+            ).scalar()
+        if recreate and stored_hash == sql_hash and _view_exists(session, view_name):
+            session.execute(_refresh_stmt(view_name))
+            session.commit()
+            logger.debug(f"Refreshed materialized view '{view_name}'.")
+            return
         if recreate:
-            session.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {view_name};"))
-        session.execute(
-            text(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {view_name} AS ({query});"),
-        )
+            session.execute(_drop_stmt(view_name))
+        if not recreate and _view_exists(session, view_name):
+            populate = False
+        else:
+            # Register the view metadata-only first, then populate via
+            # REFRESH; a failed population then leaves a cheap empty shell
+            # instead of holding the creation locks for the whole build
+            session.execute(
+                text(
+                    f"CREATE MATERIALIZED VIEW IF NOT EXISTS {view_name} AS ({query}) WITH NO DATA;",
+                ),
+            )
+            session.commit()
+            populate = True
+        if populate:
+            session.execute(_refresh_stmt(view_name))
+            # Only record the hash for a view actually built from this query;
+            # an untouched pre-existing view still holds its old definition
+            session.execute(
+                text(
+                    "INSERT INTO resqdb_view_meta (view_name, sql_sha256) VALUES (:name, :hash) "
+                    "ON CONFLICT (view_name) DO UPDATE SET sql_sha256 = EXCLUDED.sql_sha256",
+                ),
+                {"name": view_name, "hash": sql_hash},
+            )
         session.commit()
-        logger.info(f"Created materialized view '{view_name}'.")
+        logger.debug(f"Created materialized view '{view_name}'.")
 
 
 def create_all_views(*, recreate: bool = False) -> None:
@@ -71,24 +238,85 @@ def create_all_views(*, recreate: bool = False) -> None:
             if it already exists. Defaults to False.
 
     """
-    for view_path in get_views():
-        query = read_query(view_path)
-        create_view(view_path.stem, query, recreate=recreate)
+    view_paths = list(get_views())
+    if not view_paths:
+        return
+    # One round-trip for all stored hashes instead of one SELECT per view
+    stored_hashes = _stored_view_hashes()
+    start = time.perf_counter()
+
+    max_workers = min(8, os.cpu_count() or 4, len(view_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Reading in the pool overlaps the file I/O of all views as well
+        queries = dict(
+            zip(
+                (view_path.stem for view_path in view_paths),
+                executor.map(read_query, view_paths),
+            ),
+        )
+
+        # Views may select from one another, so build in topological waves:
+        # each wave runs in parallel, but never before its dependencies
+        dependencies = {
+            name: {
+                other
+                for other in queries
+                if other != name and re.search(rf"\b{re.escape(other)}\b", query)
+            }
+            for name, query in queries.items()
+        }
+        sorter = graphlib.TopologicalSorter(dependencies)
+        sorter.prepare()
+        while sorter.is_active():
+            futures = {
+                name: executor.submit(
+                    create_view,
+                    name,
+                    queries[name],
+                    recreate=recreate,
+                    stored_hash=stored_hashes.get(name),
+                )
+                for name in sorter.get_ready()
+            }
+            for name, future in futures.items():
+                future.result()
+                sorter.done(name)
+    # Per-view messages are debug-level; one summary line keeps the default
+    # log free of a write per view in the hot path
+    logger.info(
+        f"Built {len(view_paths)} materialized views in {time.perf_counter() - start:.2f}s.",
+    )
 
 
 def delete_view(view_name: str) -> None:
     """Delete a materialized view."""
-    with Session(ENGINE) as session:
-        session.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {view_name};"))
-        session.commit()
+    _validate_identifier(view_name)
+    _exec_many(
+        [
+            _VIEW_META_DDL,
+            f"DROP MATERIALIZED VIEW IF EXISTS {view_name}",
+            ("DELETE FROM resqdb_view_meta WHERE view_name = %s", (view_name,)),
+        ],
+    )
     logger.info(f"Deleted materialized view '{view_name}'.")
 
 
 def delete_all_views() -> None:
     """Delete all materialized views defined in views folder."""
-    for view_path in get_views():
-        view_name = view_path.stem
-        delete_view(view_name)
+    view_names = [_validate_identifier(view_path.stem) for view_path in get_views()]
+    if not view_names:
+        return
+    # Send every drop in one multi-statement batch plus a single array-bound
+    # meta cleanup, all under one commit
+    drops = "; ".join(f"DROP MATERIALIZED VIEW IF EXISTS {name}" for name in view_names)
+    _exec_many(
+        [
+            _VIEW_META_DDL,
+            drops,
+            ("DELETE FROM resqdb_view_meta WHERE view_name = ANY(%s)", (view_names,)),
+        ],
+    )
+    logger.info("Deleted all materialized views.")
 
 
 if __name__ == "__main__":